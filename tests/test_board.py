@@ -0,0 +1,67 @@
+import sys
+import unittest
+
+from tetris import Board
+
+
+class TestEmptyReversedSlices(unittest.TestCase):
+    def test_assign_scalar_1d(self) -> None:
+        board = Board([1, 2, 3])
+        board[-10::-1] = 7
+        self.assertEqual(board.shape, (3,))
+        self.assertEqual(list(board.data), [1, 2, 3])
+
+    def test_assign_scalar_row_view(self) -> None:
+        board = Board([[1, 2, 3], [4, 5, 6]])
+        board[0][-10::-1] = 7
+        self.assertEqual(board.tobytes(), bytes([1, 2, 3, 4, 5, 6]))
+
+    def test_assign_2d(self) -> None:
+        board = Board([[1, 2, 3], [4, 5, 6]])
+        board[-10::-1] = 7
+        board[-10::-1] = [1, 1, 1]
+        self.assertEqual(board.tobytes(), bytes([1, 2, 3, 4, 5, 6]))
+
+    def test_read_empty(self) -> None:
+        board = Board([1, 2, 3])[-10::-1]
+        self.assertEqual(board.shape, (0,))
+        self.assertEqual(list(board.data), [])
+        self.assertEqual(board.tobytes(), b"")
+        self.assertEqual(list(board), [])
+
+    def test_read_reversed_1d(self) -> None:
+        board = Board([1, 2, 3])[::-1]
+        self.assertEqual(list(board.data), [3, 2, 1])
+        self.assertEqual(list(board), [3, 2, 1])
+        self.assertEqual(list(Board([[1, 2], [3, 4]])[::-1][1]), [1, 2])
+
+
+class TestBuffer(unittest.TestCase):
+    def test_contiguous(self) -> None:
+        board = Board([[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(board.buffer.shape, (2, 3))
+        self.assertEqual(board.buffer.tolist(), [[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(board[1].buffer.tolist(), [4, 5, 6])
+        self.assertEqual(board[1:].buffer.tolist(), [[4, 5, 6]])
+
+    def test_writes_through(self) -> None:
+        board = Board([[1, 2, 3], [4, 5, 6]])
+        board.buffer[1, 2] = 0
+        self.assertEqual(board[1, 2], 0)
+
+    def test_strided(self) -> None:
+        board = Board([[1, 2, 3], [4, 5, 6], [7, 1, 2]])
+        for view in (board[::2], board[::-1], board[0][::2]):
+            with self.assertRaises(BufferError):
+                view.buffer
+
+    @unittest.skipIf(sys.version_info < (3, 12), "PEP 688 requires python 3.12")
+    def test_memoryview(self) -> None:
+        board = Board([[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(memoryview(board).tolist(), [[1, 2, 3], [4, 5, 6]])
+        with self.assertRaises(BufferError):
+            memoryview(board[::2])
+
+
+if __name__ == "__main__":
+    unittest.main()
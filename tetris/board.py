@@ -21,8 +21,28 @@ _BAD_AXIS_LENGTH = "board axis {} must have non-zero length"
 _INHOMOGENEOUS_SEQ = "the given sequence is not homogeneous. can't create board"
 _BAD_RESHAPE = "can't reshape {} into {}"
 
+# repeating an array is a single allocation + fill in C, unlike converting
+# from a zeroed bytes object (which allocates and zeroes twice)
+_ZERO = array.array("B", [0])
 
-def _broadcast(board: Any, shape: tuple[int, ...]) -> Board:
+
+def _tile_table(tiles: dict[int, str]) -> tuple[str, ...]:
+    # text for every possible mino value, including the separator. pieces are
+    # shown by name, anything not in `tiles` or `MinoType` as "?"
+    return tuple(
+        (tiles.get(i) or PieceType(i).name if i <= max(MinoType) else "?") + " "
+        for i in range(256)
+    )
+
+
+# text shown in reprs for every possible mino value
+_REPR_TILES = _tile_table(
+    {MinoType.EMPTY: ".", MinoType.GHOST: "@", MinoType.GARBAGE: "X"}
+)
+
+
+def _broadcast(board: Any, shape: tuple[int, ...]) -> array.array[int]:
+    # returns the broadcast board's data directly, as callers only need that
     if not isinstance(board, Board):
         board = Board(board)
 
@@ -33,13 +53,37 @@ def _broadcast(board: Any, shape: tuple[int, ...]) -> Board:
         if board._shape != shape:
             raise ValueError(_BAD_BROADCAST.format(board._shape, shape))
         # same shapes, no broadcasting
-        return cast(Board, board).copy()
+        return cast(Board, board).data
 
     if board._shape[0] != shape[1]:
         raise ValueError(_BAD_BROADCAST.format(board._shape, shape))
 
     # repeat data across first axis: (y) -> (x, y)
-    return Board([[*board.data]] * shape[0])
+    return cast(Board, board).data * shape[0]
+
+
+def _buffer_slice(start: int, stop: int, step: int) -> slice:
+    if start == stop:
+        # nothing to select. mapping the stop below would select everything
+        return slice(0, 0)
+    # a negative stop would wrap around to the end of the buffer
+    return slice(start, stop if stop >= 0 else None, step)
+
+
+def _extend(data: array.array[int], seq: Iterable[Any]) -> None:
+    size = len(data)
+    try:
+        # sequences of plain ints can be copied entirely in C
+        data.extend(seq)
+        return
+    except TypeError:
+        del data[size:]
+
+    # anything else (e.g. floats) is checked and converted one by one
+    for i in seq:
+        if hasattr(i, "__len__"):
+            raise ValueError(_INHOMOGENEOUS_SEQ)
+        data.append(int(i))
 
 
 def _reshape(old_shape: tuple[int, ...], new_shape: tuple[int, ...]) -> tuple[int, ...]:
@@ -136,6 +180,7 @@ class Board:
     _strides: tuple[int, ...]
     _base: Optional[Board]
     _data: array.array[int]
+    _interface: Optional[dict[str, Any]]
 
     __slots__ = (
         "_shape",
@@ -144,6 +189,7 @@ class Board:
         "_strides",
         "_base",
         "_data",
+        "_interface",
     )
 
     def __new__(cls, obj: BoardLike, shape: Optional[tuple[int, ...]] = None) -> Board:
@@ -157,7 +203,7 @@ class Board:
                 shape = _reshape(b._shape, shape)
                 b._shape = shape
                 b._ndim = len(shape)
-                b._strides = shape[1:] + (1,)
+                b._strides = (shape[1], 1) if b._ndim == 2 else (1,)
             return b
 
         if hasattr(obj, "__array__") and "numpy" in sys.modules:
@@ -178,6 +224,7 @@ class Board:
                 self._strides = arr.strides
                 self._base = None
                 self._data = array.array("B", arr.data.tobytes())
+                self._interface = None
                 return self
 
         if hasattr(obj, "__len__"):
@@ -203,19 +250,13 @@ class Board:
                 for ln in obj:
                     if not hasattr(ln, "__len__") or len(ln) != s_shape[1]:
                         raise ValueError(_INHOMOGENEOUS_SEQ)
-                    for i in ln:
-                        if hasattr(i, "__len__"):
-                            raise ValueError(_INHOMOGENEOUS_SEQ)
-                        data.append(int(i))
+                    _extend(data, ln)
             else:
                 if TYPE_CHECKING:
                     obj = cast(Sequence[SupportsIndex], obj)
                 # not nested - 1d
                 data = array.array("B")
-                for i in obj:
-                    if hasattr(i, "__len__"):
-                        raise ValueError(_INHOMOGENEOUS_SEQ)
-                    data.append(int(i))
+                _extend(data, obj)
 
             self = object.__new__(cls)
             if shape is not None:
@@ -224,10 +265,11 @@ class Board:
                 self._shape = s_shape
 
             self._ndim = len(self._shape)
-            self._strides = self._shape[1:] + (1,)
+            self._strides = (self._shape[1], 1) if self._ndim == 2 else (1,)
             self._offset = 0
             self._base = None
             self._data = data
+            self._interface = None
             return self
 
         raise TypeError(f"can't convert {obj} into {cls.__name__}")
@@ -250,10 +292,11 @@ class Board:
         self._shape = shape
         self._ndim = len(shape)
         self._offset = 0
-        # incorrect for >=3d
-        self._strides = shape[1:] + (1,)
+        self._strides = (shape[1], 1) if self._ndim == 2 else (1,)
         self._base = None
-        self._data = array.array("B", bytes(math.prod(shape)))
+        # the first stride is the row length, so this is the board's size
+        self._data = _ZERO * (shape[0] * self._strides[0])
+        self._interface = None
         return self
 
     @classmethod
@@ -288,10 +331,11 @@ class Board:
         self._ndim = len(shape)
         self._offset = offset
         if strides is None:
-            strides = shape[1:] + (1,)
+            strides = (shape[1], 1) if self._ndim == 2 else (1,)
         self._strides = strides
         self._base = None
         self._data = buffer
+        self._interface = None
         return self
 
     @classmethod
@@ -307,10 +351,9 @@ class Board:
         self._ndim = len(shape)
         self._offset = offset
         self._strides = strides
-        self._base = base
-        if base._base is not None:
-            self._base = base._base
+        self._base = base if base._base is None else base._base
         self._data = base._data
+        self._interface = None
         return self
 
     # allows seamless integration with numpy
@@ -318,14 +361,17 @@ class Board:
 
     @property
     def __array_interface__(self) -> dict[str, Any]:
-        return {
-            "data": self._data,
-            "offset": self._offset,
-            "shape": self._shape,
-            "strides": self._strides,
-            "typestr": "|u1",
-            "version": 3,
-        }
+        # a board's geometry never changes, so the dict only needs building once
+        if self._interface is None:
+            self._interface = {
+                "data": self._data,
+                "offset": self._offset,
+                "shape": self._shape,
+                "strides": self._strides,
+                "typestr": "|u1",
+                "version": 3,
+            }
+        return self._interface
 
     @property
     def shape(self) -> tuple[int, ...]:
@@ -363,8 +409,18 @@ class Board:
         stop = self._offset + self._strides[0] * self._shape[0]
         stride = self._strides[0]
         if self._ndim == 1:
-            return self._data[start:stop:stride]
+            return self._data[_buffer_slice(start, stop, stride)]
+        if stride == self._strides[1] * self._shape[1]:
+            # evenly spaced rows, which can be copied as a single block
+            return self._data[_buffer_slice(start, stop, self._strides[1])]
         arr = array.array("B")
+        if self._strides[1] == 1:
+            # contiguous rows can be copied straight out of the buffer
+            cols = self._shape[1]
+            with memoryview(self._data) as mv:
+                for i in range(start, stop, stride):
+                    arr.frombytes(mv[i : i + cols])
+            return arr
         for i in range(start, stop, stride):
             arr += self._data[
                 i :
@@ -373,6 +429,30 @@ class Board:
             ]  # fmt: skip
         return arr
 
+    @property
+    def buffer(self) -> memoryview:
+        """A `memoryview` onto the board's data, with the board's shape.
+
+        Unlike `data`, this is not a copy, so writing to it changes the board.
+
+        Raises
+        ------
+        BufferError
+            The board is not laid out contiguously (e.g. a view sliced with a
+            step), or it is a 2d board with no elements.
+        """
+        if not self._is_contiguous():
+            raise BufferError("only contiguous boards can be exported as buffers")
+        start = self._offset
+        stop = start + self._shape[0] * self._strides[0]
+        view = memoryview(self._data)[start:stop]
+        if self._ndim == 1:
+            return view
+        if 0 in self._shape:
+            # memoryviews can't be cast into shapes with zeros
+            raise BufferError("empty 2d boards can't be exported as buffers")
+        return view.cast("B", self._shape)
+
     def tobytes(self) -> bytes:
         """Return a copy of this board as a bytes object.
 
@@ -382,6 +462,13 @@ class Board:
         -------
         bytes
         """
+        if (
+            self._offset == 0
+            and self._is_contiguous()
+            and len(self._data) == self._shape[0] * self._strides[0]
+        ):
+            # this board covers its whole buffer in order, no slicing needed
+            return self._data.tobytes()
         return self.data.tobytes()
 
     def copy(self) -> Board:
@@ -390,24 +477,42 @@ class Board:
         new._shape = self._shape
         new._ndim = self._ndim
         new._offset = 0
-        new._strides = self._shape[1:] + (1,)
+        new._strides = (self._shape[1], 1) if self._ndim == 2 else (1,)
         new._base = None
-        new._data = self.data
+        if self._offset == 0 and self._strides == new._strides:
+            # already laid out contiguously, clone the buffer directly
+            new._data = self._data[: self._shape[0] * new._strides[0]]
+        else:
+            new._data = self.data
+        new._interface = None
         return new
 
+    def _get_unchecked(self, a: int, b: int) -> int:
+        """Return the mino at ``[a, b]`` of a 2d board without any checks.
+
+        This is internal only, for hot loops that already validated their
+        indices (e.g. collision checks). Negative and out of bounds indices
+        are *not* handled and will silently read the wrong mino.
+        """
+        return self._data[self._offset + a * self._strides[0] + b * self._strides[1]]
+
     def _normalize_index(
         self, key: Union[int, slice, tuple[int, int]]
     ) -> Union[int, slice, tuple[int, int]]:
         """Apply various checks and convert things like negative indices."""
-        if hasattr(key, "__index__"):
-            k = int(key)  # type: ignore[arg-type]
+        # exact type checks come first, as they're much cheaper than hasattr()
+        if type(key) is int or (
+            not isinstance(key, (slice, tuple)) and hasattr(key, "__index__")
+        ):
+            k = key if type(key) is int else int(key)
+            rows = self._shape[0]
             if k < 0:
-                k += self._shape[0]
-            if not 0 <= k < self._shape[0]:
+                k += rows
+            if not 0 <= k < rows:
                 raise IndexError(_OUT_OF_BOUNDS.format(key, 0))
             return k
 
-        if isinstance(key, slice):
+        if type(key) is slice:
             # nothing to be done really
             return key
 
@@ -415,40 +520,62 @@ class Board:
             if self._ndim != 2 or len(key) != 2:
                 raise ValueError("can only index 2d arrays with 2-tuples")
             a, b = key
-            if not hasattr(a, "__index__") or not hasattr(b, "__index__"):
-                raise TypeError(
-                    _BAD_INDEX_TYPE.format(f"({type(a).__name__}, {type(b).__name__})")
-                )
-            a, b = int(a), int(b)
+            if type(a) is not int or type(b) is not int:
+                if not hasattr(a, "__index__") or not hasattr(b, "__index__"):
+                    raise TypeError(
+                        _BAD_INDEX_TYPE.format(
+                            f"({type(a).__name__}, {type(b).__name__})"
+                        )
+                    )
+                a, b = int(a), int(b)
+            rows, cols = self._shape
             if a < 0:
-                a += self._shape[0]
-            if not 0 <= a < self._shape[0]:
+                a += rows
+            if not 0 <= a < rows:
                 raise IndexError(_OUT_OF_BOUNDS.format(key[0], 0))
             if b < 0:
-                b += self._shape[1]
-            if not 0 <= b < self._shape[1]:
+                b += cols
+            if not 0 <= b < cols:
                 raise IndexError(_OUT_OF_BOUNDS.format(key[1], 1))
             return a, b
 
         raise TypeError(_BAD_INDEX_TYPE.format(type(key).__name__))
 
-    def _contiguous_blocks(self, key: slice) -> Iterator[tuple[int, int, int]]:
-        """Yield largest contiguous blocks for a given slice."""
+    def _is_contiguous(self) -> bool:
+        """Return True if this board's elements are laid out in C order."""
+        return self._strides[-1] == 1 and (
+            self._ndim == 1 or self._strides[0] == self._shape[1]
+        )
+
+    def _slice_shape(self, key: slice) -> tuple[int, ...]:
+        """Return the shape of the view a slice would create."""
+        return (len(range(*key.indices(self._shape[0]))), *self._shape[1:])
+
+    def _contiguous_blocks(self, key: slice) -> list[tuple[slice, int]]:
+        """Return the largest contiguous blocks for a given slice.
+
+        Each block is a slice into `_data`, paired with its length.
+        """
         start, stop, step = key.indices(self._shape[0])
+        rows = len(range(start, stop, step))
+        if rows == 0:
+            return []
         stride = self._strides[0] * step
         offset = self._offset + start * self._strides[0]
-        length = stride * max(math.ceil((stop - start) / step), 0)
+        length = stride * rows
         # only a single row
         if self._ndim == 1:
-            yield (offset, offset + length, stride)
-            return
+            return [(_buffer_slice(offset, offset + length, stride), rows)]
         # evenly spaced rows
-        if self._strides[1] * self._shape[1] == stride:
-            yield (offset, offset + length, self._strides[1])
-            return
+        row_length = self._strides[1] * self._shape[1]
+        if row_length == stride:
+            block = _buffer_slice(offset, offset + length, self._strides[1])
+            return [(block, rows * self._shape[1])]
         # worst case - all rows are incontiguous (e.g. when slicing as [::2])
-        for i in range(offset, offset + length, stride):
-            yield (i, i + self._strides[1] * self._shape[1], self._strides[1])
+        return [
+            (_buffer_slice(i, i + row_length, self._strides[1]), self._shape[1])
+            for i in range(offset, offset + length, stride)
+        ]
 
     @overload
     def __getitem__(self, key: slice) -> Board:
@@ -463,6 +590,15 @@ class Board:
         ...
 
     def __getitem__(self, key: Union[int, slice, tuple[int, int]]) -> Union[Board, int]:
+        # fast path for in-bounds (int, int) indices, the most common case by far
+        if type(key) is tuple and len(key) == 2 and self._ndim == 2:
+            a, b = key
+            if type(a) is int and type(b) is int:
+                if 0 <= a < self._shape[0] and 0 <= b < self._shape[1]:
+                    return self._data[
+                        self._offset + a * self._strides[0] + b * self._strides[1]
+                    ]
+
         key = self._normalize_index(key)
 
         if isinstance(key, int):
@@ -481,7 +617,7 @@ class Board:
 
             return Board._view(
                 self,
-                (max(math.ceil((stop - start) / step), 0), *self._shape[1:]),
+                (len(range(start, stop, step)), *self._shape[1:]),
                 self._offset + start * self._strides[0],
                 (self._strides[0] * step, *self._strides[1:]),
             )
@@ -492,91 +628,105 @@ class Board:
     def __setitem__(
         self, key: Union[int, slice, tuple[int, int]], value: Union[Board, int]
     ) -> None:
+        # fast path for storing an int at in-bounds (int, int) indices
+        if type(key) is tuple and len(key) == 2 and self._ndim == 2:
+            a, b = key
+            if type(a) is int and type(b) is int and type(value) is int:
+                if 0 <= a < self._shape[0] and 0 <= b < self._shape[1]:
+                    self._data[
+                        self._offset + a * self._strides[0] + b * self._strides[1]
+                    ] = value
+                    return
+
         key = self._normalize_index(key)
 
+        # plain ints are by far the most common values, check for them first
+        scalar = 0
+        is_seq = False
+        if type(value) is int:
+            scalar = value
+        elif hasattr(value, "__len__"):
+            is_seq = True
+        elif hasattr(value, "__index__"):
+            scalar = int(value)
+        else:
+            raise TypeError(_BAD_VALUE_TYPE)
+
         if isinstance(key, int):
             offset = self._offset + key * self._strides[0]
-            if hasattr(value, "__len__"):
-                if self._ndim == 1:
+            if self._ndim == 1:
+                if is_seq:
                     raise TypeError("can't assign sequence to element index")
-                length = self._shape[1]
-                stride = self._strides[1]
-                arr = _broadcast(value, (self._shape[1],))
-                self._data[offset : offset + length : stride] = arr.data
+                self._data[offset] = scalar
+                return
+
+            length = self._shape[1]
+            stride = self._strides[1]
+            row = _buffer_slice(offset, offset + length * stride, stride)
+            if is_seq:
+                self._data[row] = _broadcast(value, (length,))
             else:
-                if not hasattr(value, "__index__"):
-                    raise TypeError(_BAD_VALUE_TYPE)
-                if self._ndim == 1:
-                    self._data[offset] = int(value)
-                else:
-                    length = self._shape[1]
-                    stride = self._strides[1]
-                    for i in range(offset, offset + length, stride):
-                        self._data[i] = int(value)
+                self._data[row] = array.array("B", (scalar,)) * length
 
         elif isinstance(key, slice):
-            if hasattr(value, "__len__"):
-                arr = _broadcast(value, self[key]._shape)
-                if arr._base is not None:
-                    arr = arr.copy()  # FIXME: can this be done without copying?
+            if is_seq:
+                arr = _broadcast(value, self._slice_shape(key))
+                blocks = self._contiguous_blocks(key)
+                if len(blocks) == 1:
+                    self._data[blocks[0][0]] = arr
+                    return
                 x = 0
-                for start, stop, step in self._contiguous_blocks(key):
-                    length = len(self._data[start:stop:step])
-                    self._data[start:stop:step] = arr._data[x : x + length]
+                for block, length in blocks:
+                    self._data[block] = arr[x : x + length]
                     x += length
             else:
-                if not hasattr(value, "__index__"):
-                    raise TypeError(_BAD_VALUE_TYPE)
-
-                for start, stop, step in self._contiguous_blocks(key):
-                    for i in range(start, stop, step):
-                        self._data[i] = int(value)
+                fill = array.array("B", (scalar,))
+                for block, length in self._contiguous_blocks(key):
+                    self._data[block] = fill * length
 
         else:
-            a, b = key
-            if not hasattr(value, "__index__"):
+            if is_seq:
                 raise TypeError(_BAD_VALUE_TYPE)
-
+            a, b = key
             self._data[
                 self._offset + a * self._strides[0] + b * self._strides[1]
-            ] = int(value)
+            ] = scalar
 
     def __iter__(self) -> Iterator[Any]:
         start = self._offset
         stop = self._offset + self._strides[0] * self._shape[0]
         stride = self._strides[0]
         if self._ndim == 1:
-            yield from self._data[start:stop:stride]
+            yield from self._data[_buffer_slice(start, stop, stride)]
         else:
+            # every row view can share the same shape and strides tuples
+            shape = (self._shape[1],)
+            strides = (self._strides[1],)
             for i in range(start, stop, stride):
-                yield Board._view(self, (self._shape[1],), i, (self._strides[1],))
+                yield Board._view(self, shape, i, strides)
 
     def __len__(self) -> int:
         return self._shape[0]
 
-    def __repr__(self) -> str:
-        max_i = max(MinoType)
-        tiles = {
-            MinoType.EMPTY: ".",
-            MinoType.GHOST: "@",
-            MinoType.GARBAGE: "X",
-        }
-        text = ""
+    # buffer protocol (PEP 688), allows memoryview(board) on python 3.12+
+    # https://docs.python.org/3/reference/datamodel.html#emulating-buffer-types
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.buffer
 
+    def __repr__(self) -> str:
+        data = self.data
         if self._ndim == 1:
-            for i in self:
-                text += tiles.get(i) or PieceType(i).name
-                text += " "
+            text = "".join([_REPR_TILES[i] for i in data])
         else:
-            for line in self:
-                text += "        "
-                for i in line:
-                    if i > max_i:
-                        text += "? "
-                        continue
-                    text += tiles.get(i) or PieceType(i).name
-                    text += " "
-                text += "\n"
+            cols = self._shape[1]
+            text = "".join(
+                [
+                    "        "
+                    + "".join([_REPR_TILES[i] for i in data[j * cols : (j + 1) * cols]])
+                    + "\n"
+                    for j in range(self._shape[0])
+                ]
+            )
 
         text = text.lstrip(" ")
         text = text.rstrip("\n")
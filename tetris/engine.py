@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import abc
 import dataclasses
+import itertools
 import random
 import secrets
+from collections import deque
 from collections.abc import Iterable, Iterator, Sequence
 from typing import TYPE_CHECKING, Any, Optional, Union, final, overload
 
@@ -158,7 +160,7 @@ class Queue(EnginePart, Sequence[PieceType]):
         The pieces to initialise this queue with.
     seed : Seed, optional
         The seed used to generate the pieces. Defaults to
-        `secrets.token_bytes()`.
+        `secrets.randbits(128)`.
 
     Notes
     -----
@@ -169,9 +171,9 @@ class Queue(EnginePart, Sequence[PieceType]):
     When subclassing, you usually only need to override `fill`. This method
     is expected to unconditionally append at least one `PieceType` to
     `_pieces`. This method will be called when the minimum amount of pieces is
-    exhausted (on `BaseGame`, it's by default 4). `_pieces` is a list of
-    `PieceType`, and `_random` is a `random.Random` instance using the game's
-    seed.
+    exhausted (on `BaseGame`, it's by default 4). `_pieces` is a
+    `collections.deque` of `PieceType`, and `_random` is a `random.Random`
+    instance using the game's seed.
 
     `RuntimeError` will be raised if `fill` does not increase the length of
     `_pieces`.
@@ -190,22 +192,23 @@ class Queue(EnginePart, Sequence[PieceType]):
     def __init__(
         self, pieces: Optional[Iterable[int]] = None, seed: Optional[Seed] = None
     ):
-        seed = seed or secrets.token_bytes()
+        seed = seed or secrets.randbits(128)
         self._seed = seed
         self._random = random.Random(seed)
-        self._pieces = [PieceType(i) for i in pieces or []]
+        self._pieces = deque(map(PieceType, pieces or ()))
         self._size = 7  # May be changed by a game class
         self._safe_fill()
 
     def _safe_fill(self) -> None:
-        prev_size = len(self._pieces)
-        while len(self._pieces) <= self._size:
+        size = len(self._pieces)
+        while size <= self._size:
             self.fill()
-            if prev_size >= len(self._pieces):
+            new_size = len(self._pieces)
+            if size >= new_size:
                 # Prevent an infinite loop
                 raise RuntimeError("fill() did not increase `_pieces`!")
 
-            prev_size = len(self._pieces)
+            size = new_size
 
     @classmethod
     def from_game(cls, game: BaseGame, pieces: Optional[Iterable[int]] = None) -> Queue:
@@ -215,7 +218,7 @@ class Queue(EnginePart, Sequence[PieceType]):
     def pop(self) -> PieceType:
         """Remove and return the first piece of the queue."""
         self._safe_fill()
-        return self._pieces.pop(0)
+        return self._pieces.popleft()
 
     @abc.abstractmethod
     def fill(self) -> None:
@@ -233,10 +236,7 @@ class Queue(EnginePart, Sequence[PieceType]):
         return self._seed
 
     def __iter__(self) -> Iterator[PieceType]:
-        for i, j in enumerate(self._pieces):
-            if i >= self._size:
-                break
-            yield j
+        return itertools.islice(self._pieces, self._size)
 
     @overload
     def __getitem__(self, i: int) -> PieceType:
@@ -247,7 +247,10 @@ class Queue(EnginePart, Sequence[PieceType]):
         ...
 
     def __getitem__(self, i: Union[int, slice]) -> Union[list[PieceType], PieceType]:
-        return self._pieces[: self._size][i]
+        if type(i) is int and -self._size <= i < self._size:
+            # plain in-bounds indices don't need the visible pieces copied
+            return self._pieces[i if i >= 0 else i + self._size]
+        return list(itertools.islice(self._pieces, self._size))[i]
 
     def __len__(self) -> int:
         return self._size
@@ -342,14 +345,16 @@ class RotationSystem(EnginePart):
             px = piece.x
             py = piece.y
 
+        board = self.board
+        mx, my = board.shape
         for x, y in minos:
-            if x + px not in range(self.board.shape[0]):
+            x += px
+            y += py
+            if not (0 <= x < mx and 0 <= y < my):
                 return True
 
-            if y + py not in range(self.board.shape[1]):
-                return True
-
-            if self.board[x + px, y + py] != 0:
+            # indices were checked above
+            if board._get_unchecked(x, y) != 0:
                 return True
 
         return False
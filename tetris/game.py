@@ -1,11 +1,10 @@
 """Primary implementation for game objects."""
 
-import dataclasses
 import math
 from collections.abc import Iterable
 from typing import Any, Optional, Union
 
-from tetris.board import Board
+from tetris.board import Board, _tile_table
 from tetris.engine import Engine, EngineFactory, Parts
 from tetris.impl.presets import Modern
 from tetris.types import (
@@ -22,6 +21,11 @@ from tetris.types import (
     Seed,
 )
 
+# text shown by BaseGame.__str__ for every possible mino value
+_STR_TILES = _tile_table(
+    {MinoType.EMPTY: " ", MinoType.GHOST: "@", MinoType.GARBAGE: "X"}
+)
+
 
 class BaseGame:
     """Base class for tetris games.
@@ -263,6 +267,7 @@ class BaseGame:
         """
         board = self.board.copy()
         piece = self.piece
+
         ghost_x = piece.x
 
         for x in range(piece.x + 1, board.shape[0]):
@@ -311,8 +316,9 @@ class BaseGame:
     def _lock_piece(self) -> None:
         assert self.delta
         piece = self.piece
+        minos = piece.minos
         for x in range(piece.x + 1, self.board.shape[0]):
-            if self.rs.overlaps(dataclasses.replace(piece, x=x)):
+            if self.rs.overlaps(minos=minos, px=x, py=piece.y):
                 break
 
             piece.x = x
@@ -329,8 +335,12 @@ class BaseGame:
         else:
             self._lose()
 
-        for i, row in enumerate(self.board):
-            if all(row):
+        # Clearing row i only shifts rows above it, so every row can be
+        # checked against a single snapshot taken before any clears
+        rows, cols = self.board.shape
+        data = self.board.tobytes()
+        for i in range(rows):
+            if 0 not in data[i * cols : (i + 1) * cols]:
                 self.board[0] = 0
                 self.board[1 : i + 1] = self.board[:i]
                 self.delta.clears.append(i)
@@ -362,10 +372,11 @@ class BaseGame:
         piece = self.piece
         from_x = piece.x
         from_y = piece.y
+        minos = piece.minos
 
         x_step = int(math.copysign(1, x - from_x))
         for x in range(from_x, x + x_step, x_step):
-            if self.rs.overlaps(dataclasses.replace(piece, x=x)):
+            if self.rs.overlaps(minos=minos, px=x, py=piece.y):
                 break
 
             self.delta.x = x - piece.x
@@ -373,7 +384,7 @@ class BaseGame:
 
         y_step = int(math.copysign(1, y - from_y))
         for y in range(from_y, y + y_step, y_step):
-            if self.rs.overlaps(dataclasses.replace(piece, y=y)):
+            if self.rs.overlaps(minos=minos, px=piece.x, py=y):
                 break
 
             self.delta.y = y - piece.y
@@ -486,18 +497,15 @@ class BaseGame:
         self.push(Move.swap())
 
     def __str__(self) -> str:
-        tiles = {
-            MinoType.EMPTY: " ",
-            MinoType.GHOST: "@",
-            MinoType.GARBAGE: "X",
-        }
-
-        text = ""
-        for line in self.playfield:
-            for i in line:
-                text += tiles.get(i) or PieceType(i).name
-                text += " "
-            text += "\n"
+        playfield = self.playfield
+        data = playfield.data
+        cols = playfield.shape[1]
+        text = "".join(
+            [
+                "".join([_STR_TILES[i] for i in data[j * cols : (j + 1) * cols]]) + "\n"
+                for j in range(playfield.shape[0])
+            ]
+        )
 
         return text.rstrip("\n")
 
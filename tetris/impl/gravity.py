@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Final, Optional
 
 from tetris.engine import Gravity
@@ -13,6 +14,25 @@ if TYPE_CHECKING:
 
 SECOND: Final[int] = 1_000_000_000  # in nanoseconds
 
+# NES runs at 60.0988 fps
+NES_GRAV_FRAMES: Final[dict[int, int]] = {
+    29: 1,
+    19: 2,
+    16: 3,
+    13: 4,
+    10: 5,
+    9: 6,
+    8: 8,
+    7: 13,
+    6: 18,
+    5: 23,
+    4: 28,
+    3: 33,
+    2: 38,
+    1: 43,
+    0: 48,
+}
+
 
 class Timer:
     """Helper class for time-keeping.
@@ -43,7 +63,7 @@ class Timer:
 
     def start(self) -> None:
         """(re)start the timer."""
-        self.started = time.monotonic_ns()
+        self.started = time.perf_counter_ns()
         self.running = True
 
     def stop(self) -> None:
@@ -54,7 +74,55 @@ class Timer:
     @property
     def done(self) -> bool:
         """True if this timer is running and has finished."""
-        return self.running and self.started + self.duration <= time.monotonic_ns()
+        return self.is_done(time.perf_counter_ns())
+
+    def is_done(self, now: int) -> bool:
+        """Check if this timer is running and has finished by `now`.
+
+        Parameters
+        ----------
+        now : int
+            The current time, as returned by `time.perf_counter_ns`.
+        """
+        return self.running and self.started + self.duration <= now
+
+
+class _DropDelay:
+    """Level-keyed cache for a gravity's drop delay.
+
+    The drop delay only changes with the level, so `formula` is only called
+    again after the level changes.
+
+    Parameters
+    ----------
+    formula : Callable[[int], float]
+        Returns the drop delay in nanoseconds for a given level.
+    """
+
+    __slots__ = ("delay", "formula", "level")
+
+    def __init__(self, formula: Callable[[int], float]):
+        self.formula = formula
+        self.level: Optional[int] = None
+        self.delay = 0.0
+
+    def get(self, level: int) -> float:
+        """Return the drop delay for `level`, in nanoseconds."""
+        if level != self.level:
+            self.delay = self.formula(level)
+            self.level = level
+        return self.delay
+
+
+def _marathon_drop_delay(level: int) -> float:
+    return (0.8 - ((level - 1) * 0.007)) ** (level - 1) * SECOND
+
+
+def _nes_drop_delay(level: int) -> float:
+    for i in NES_GRAV_FRAMES:
+        if level >= i:
+            return NES_GRAV_FRAMES[i] * (SECOND / 60.0988)
+    raise ValueError(f"invalid level: {level}")
 
 
 class InfinityGravity(Gravity):
@@ -70,21 +138,31 @@ class InfinityGravity(Gravity):
 
         self.idle_lock = Timer(milliseconds=500)
         self.lock_resets = 0
-        self.last_drop = time.monotonic_ns()
+        self.last_drop = time.perf_counter_ns()
+        self._drop_delay = _DropDelay(_marathon_drop_delay)
 
     def calculate(self, delta: Optional[MoveDelta] = None) -> None:  # noqa: D102
-        level = self.game.level
-        piece = self.game.piece
-        drop_delay = (0.8 - ((level - 1) * 0.007)) ** (level - 1) * SECOND
-        now = time.monotonic_ns()
+        drop_delay = self._drop_delay.get(self.game.level)
+        now = time.perf_counter_ns()
+
+        # idle ticks between drops can neither lock nor move the piece
+        if (
+            delta is None
+            and not self.idle_lock.running
+            and now - self.last_drop < drop_delay
+        ):
+            return
 
+        piece = self.game.piece
         if delta is not None:
+            # neither the piece nor the board change until the lock check
+            grounded = self.game.rs.overlaps(
+                minos=piece.minos, px=piece.x + 1, py=piece.y
+            )
             if (
                 delta.kind == MoveKind.HARD_DROP
                 or delta.kind == MoveKind.SWAP
-                or not self.game.rs.overlaps(
-                    minos=piece.minos, px=piece.x + 1, py=piece.y
-                )
+                or not grounded
             ):
                 self.idle_lock.stop()
                 self.lock_resets = 0
@@ -93,12 +171,10 @@ class InfinityGravity(Gravity):
                 self.idle_lock.start()
                 self.lock_resets += 1
 
-            if not self.idle_lock.running and self.game.rs.overlaps(
-                minos=piece.minos, px=piece.x + 1, py=piece.y
-            ):
+            if not self.idle_lock.running and grounded:
                 self.idle_lock.start()
 
-        if self.idle_lock.done or self.lock_resets >= 15:
+        if self.idle_lock.is_done(now) or self.lock_resets >= 15:
             self.game.push(Move(kind=MoveKind.HARD_DROP, auto=True))
             self.idle_lock.stop()
             self.lock_resets = 0
@@ -128,37 +204,14 @@ class NESGravity(Gravity):
     def __init__(self, game: BaseGame):
         super().__init__(game)
 
-        self.last_drop = time.monotonic_ns()
+        self.last_drop = time.perf_counter_ns()
+        self._drop_delay = _DropDelay(_nes_drop_delay)
 
     def calculate(self, delta: Optional[MoveDelta] = None) -> None:  # noqa: D102
-        level = self.game.level
         piece = self.game.piece
+        drop_delay = self._drop_delay.get(self.game.level)
 
-        # NES runs at 60.0988 fps
-        NES_GRAV_FRAMES = {
-            29: 1,
-            19: 2,
-            16: 3,
-            13: 4,
-            10: 5,
-            9: 6,
-            8: 8,
-            7: 13,
-            6: 18,
-            5: 23,
-            4: 28,
-            3: 33,
-            2: 38,
-            1: 43,
-            0: 48,
-        }
-
-        for i in NES_GRAV_FRAMES:  # set gravity based on level
-            if level >= i:
-                drop_delay = NES_GRAV_FRAMES[i] * (SECOND / 60.0988)
-                break
-
-        now = time.monotonic_ns()
+        now = time.perf_counter_ns()
 
         since_drop = now - self.last_drop
         if since_drop >= drop_delay:
@@ -5,6 +5,8 @@ from __future__ import annotations
 from tetris.engine import Queue
 from tetris.types import PieceType
 
+_PIECES = tuple(PieceType)
+
 
 class SevenBag(Queue):
     """The 7-bag queue randomiser.
@@ -21,7 +23,7 @@ class SevenBag(Queue):
     """
 
     def fill(self) -> None:  # noqa: D102
-        self._pieces.extend(self._random.sample(list(PieceType), 7))
+        self._pieces.extend(self._random.sample(_PIECES, 7))
 
 
 class NES(Queue):
@@ -273,11 +273,12 @@ class SRS(RotationSystem):
     def kick_piece(
         self, table: KickTable, piece: Piece, to_r: int
     ) -> None:  # noqa: D102
-        if not (piece.r, to_r) in table:
+        offsets = table.get((piece.r, to_r))
+        if offsets is None:
             return
 
         minos = self.shapes[piece.type][to_r]
-        for x, y in table[piece.r, to_r]:
+        for x, y in offsets:
             # for each offset, test if it's valid
             if not self.overlaps(minos=minos, px=piece.x + x, py=piece.y + y):
                 # if it's valid, kick it and break
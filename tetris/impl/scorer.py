@@ -10,6 +10,17 @@ from tetris.types import MoveDelta, MoveKind, PieceType
 if TYPE_CHECKING:
     from tetris.game import BaseGame
 
+# score tables, indexed by the amount of lines cleared
+_PERFECT_CLEAR_SCORES = (0, 800, 1200, 1800, 2000)
+_TSPIN_SCORES = (400, 800, 1200, 1600, 0)
+_TSPIN_MINI_SCORES = (100, 200, 400, 0, 0)
+_LINE_CLEAR_SCORES = (0, 100, 300, 500, 800)
+_NES_SCORES = (0, 40, 100, 300, 1200)
+
+# T piece corners clockwise from top-left, and the edge after each of them
+_TSPIN_CORNERS = ((0, 0), (0, 2), (2, 2), (2, 0))
+_TSPIN_EDGES = ((0, 1), (1, 2), (2, 1), (1, 0))
+
 
 class GuidelineScorer(Scorer):
     """The Tetris Guideline scoring system.
@@ -44,20 +55,19 @@ class GuidelineScorer(Scorer):
         if delta.kind == MoveKind.ROTATE and piece.type == PieceType.T and delta.r != 0:
             px = piece.x
             py = piece.y
-            corners = []
+            mx, my = board.shape
             # check corners clockwise from top-left
-            for x, y in [(0, 0), (0, 2), (2, 2), (2, 0)]:
-                corners.append(
-                    x + px not in range(board.shape[0])
-                    or y + py not in range(board.shape[1])
-                    or board[x + px, y + py] != 0
-                )
+            corners = [
+                not (0 <= x + px < mx and 0 <= y + py < my)
+                or board._get_unchecked(x + px, y + py) != 0
+                for x, y in _TSPIN_CORNERS
+            ]
 
             back = None
             # find the back of the piece clockwise from top. note how this
             # is checked in the same order as the corners: corners[back] will
             # be the corner before the back edge (behind counter-clockwise)
-            for i, pos in enumerate([(0, 1), (1, 2), (2, 1), (1, 0)]):
+            for i, pos in enumerate(_TSPIN_EDGES):
                 if pos not in piece.minos:
                     back = i
                     break
@@ -104,19 +114,21 @@ class GuidelineScorer(Scorer):
             else:
                 self.combo = 0
 
-            perfect_clear = all(not any(row) for row in board)
+            # an all-empty board, counted in C rather than scanned row by row
+            data = board.tobytes()
+            perfect_clear = data.count(0) == len(data)
 
             if perfect_clear:
-                score += [0, 800, 1200, 1800, 2000][line_clears]
+                score += _PERFECT_CLEAR_SCORES[line_clears]
 
             elif self.tspin:
-                score += [400, 800, 1200, 1600, 0][line_clears]
+                score += _TSPIN_SCORES[line_clears]
 
             elif self.tspin_mini:
-                score += [100, 200, 400, 0, 0][line_clears]
+                score += _TSPIN_MINI_SCORES[line_clears]
 
             else:
-                score += [0, 100, 300, 500, 800][line_clears]
+                score += _LINE_CLEAR_SCORES[line_clears]
 
             if self.combo:
                 score += 50 * (self.combo - 1)
@@ -185,7 +197,7 @@ class NESScorer(Scorer):
             score = 0
             line_clears = len(delta.clears)
 
-            score += [0, 40, 100, 300, 1200][line_clears]
+            score += _NES_SCORES[line_clears]
             score *= self.level + 1
 
             self.score += score